@@ -1,12 +1,14 @@
 from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from brotli_asgi import BrotliMiddleware
 from supabase import create_client, Client
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import List, Optional, Union
 import uuid
 from datetime import datetime
 from emergentintegrations.llm.chat import LlmChat, UserMessage
@@ -19,8 +21,11 @@ supabase_url = os.environ['SUPABASE_URL']
 supabase_key = os.environ['SUPABASE_SERVICE_KEY']
 supabase: Client = create_client(supabase_url, supabase_key)
 
-# Create the main app without a prefix
-app = FastAPI()
+# Responses smaller than this are sent uncompressed
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', '1000'))
+
+# Create the main app without a prefix; plain-dict routes are rendered with orjson
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -62,6 +67,14 @@ class StatusCheck(BaseModel):
 class StatusCheckCreate(BaseModel):
     client_name: str
 
+# Built once so the compiled validators/serializers are reused on every request
+copy_history_list_adapter = TypeAdapter(List[CopyHistory])
+status_check_list_adapter = TypeAdapter(List[StatusCheck])
+
+def json_response(content: Union[str, bytes]) -> Response:
+    """Wrap pre-serialized JSON, skipping FastAPI's response_model re-validation"""
+    return Response(content=content, media_type="application/json")
+
 def create_copy_prompt(bundle_name: str, tone: str, items: List[BundleItem]) -> str:
     """Create a structured prompt for Claude to generate bundle copy"""
     
@@ -243,14 +256,14 @@ async def generate_copy(request: BundleRequest):
         )
         
         # Save to database
-        supabase.table('copy_history').insert(history_item.dict()).execute()
+        supabase.table('copy_history').insert(history_item.model_dump(mode='json')).execute()
         logging.info(f"Saved copy history for bundle: {request.bundle_name}")
         
     except Exception as e:
         logging.error(f"Error saving copy history: {str(e)}")
         # Don't fail the main request if history saving fails
     
-    return copy
+    return json_response(copy.model_dump_json())
 
 @api_router.post("/save-copy", response_model=CopyHistory)
 async def save_copy(request: BundleRequest, copy: GeneratedCopy):
@@ -263,9 +276,9 @@ async def save_copy(request: BundleRequest, copy: GeneratedCopy):
         )
         
         # Save to database
-        supabase.table('copy_history').insert(history_item.dict()).execute()
+        supabase.table('copy_history').insert(history_item.model_dump(mode='json')).execute()
         
-        return history_item
+        return json_response(history_item.model_dump_json())
         
     except Exception as e:
         logging.error(f"Error saving copy history: {str(e)}")
@@ -276,7 +289,8 @@ async def get_copy_history(limit: int = 10):
     """Get copy history"""
     try:
         response = supabase.table('copy_history').select('*').order('timestamp', desc=True).limit(limit).execute()
-        return [CopyHistory(**item) for item in response.data]
+        history = copy_history_list_adapter.validate_python(response.data)
+        return json_response(copy_history_list_adapter.dump_json(history))
         
     except Exception as e:
         logging.error(f"Error retrieving copy history: {str(e)}")
@@ -284,15 +298,16 @@ async def get_copy_history(limit: int = 10):
 
 @api_router.post("/status", response_model=StatusCheck)
 async def create_status_check(input: StatusCheckCreate):
-    status_dict = input.dict()
+    status_dict = input.model_dump()
     status_obj = StatusCheck(**status_dict)
-    supabase.table('status_checks').insert(status_obj.dict()).execute()
-    return status_obj
+    supabase.table('status_checks').insert(status_obj.model_dump(mode='json')).execute()
+    return json_response(status_obj.model_dump_json())
 
 @api_router.get("/status", response_model=List[StatusCheck])
 async def get_status_checks():
     response = supabase.table('status_checks').select('*').execute()
-    return [StatusCheck(**status_check) for status_check in response.data]
+    status_checks = status_check_list_adapter.validate_python(response.data)
+    return json_response(status_check_list_adapter.dump_json(status_checks))
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -305,6 +320,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Negotiate br/gzip from Accept-Encoding for payloads above the threshold
+app.add_middleware(BrotliMiddleware, minimum_size=COMPRESSION_MIN_SIZE, gzip_fallback=True)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
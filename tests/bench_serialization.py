@@ -0,0 +1,108 @@
+"""Compare the old and new /api/copy-history serialization paths.
+
+Run from the repo root with `python -m tests.bench_serialization`.
+"""
+import gzip
+import logging
+import time
+from typing import List
+
+import brotli
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from tests.stubs import load_server, make_history_rows
+
+ROW_COUNTS = [1, 10, 50]
+THRESHOLD_ROW_COUNTS = [1, 2, 3, 5]
+REQUESTS = 300
+
+
+def build_baseline_client(server):
+    """The handler as it was before: stock JSONResponse, model list re-validated via response_model"""
+    baseline_app = FastAPI(default_response_class=JSONResponse)
+
+    @baseline_app.get("/api/copy-history", response_model=List[server.CopyHistory])
+    async def get_copy_history(limit: int = 10):
+        response = server.supabase.table('copy_history').select('*').order('timestamp', desc=True).limit(limit).execute()
+        return [server.CopyHistory(**item) for item in response.data]
+
+    return TestClient(baseline_app)
+
+
+def cpu_per_request(client, rows):
+    headers = {"Accept-Encoding": "identity"}
+    client.get("/api/copy-history", params={"limit": rows}, headers=headers)
+    start = time.process_time()
+    for _ in range(REQUESTS):
+        client.get("/api/copy-history", params={"limit": rows}, headers=headers)
+    return (time.process_time() - start) / REQUESTS * 1e6
+
+
+def serializer_cpu(func, rounds=2000):
+    func()
+    start = time.process_time()
+    for _ in range(rounds):
+        func()
+    return (time.process_time() - start) / rounds * 1e6
+
+
+def main():
+    server = load_server()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    baseline = build_baseline_client(server)
+    current = TestClient(server.app)
+    server.supabase.table('copy_history')
+    server.supabase.tables['copy_history'].rows = make_history_rows(max(ROW_COUNTS))
+
+    print("End-to-end CPU per request through TestClient (us, identity encoding)")
+    print(f"{'rows':>6} {'baseline':>10} {'current':>10}")
+    for rows in ROW_COUNTS:
+        print(f"{rows:>6} {cpu_per_request(baseline, rows):>10.0f} {cpu_per_request(current, rows):>10.0f}")
+
+    print()
+    print("Serialization only, Supabase rows -> JSON bytes (us)")
+    print(f"{'rows':>6} {'baseline':>10} {'current':>10}")
+    baseline_route = next(r for r in baseline.app.routes if getattr(r, 'path', None) == "/api/copy-history")
+    response_field = baseline_route.response_field
+    adapter = server.copy_history_list_adapter
+    for rows in ROW_COUNTS:
+        data = server.supabase.tables['copy_history'].rows[:rows]
+
+        def old_path():
+            models = [server.CopyHistory(**item) for item in data]
+            value, _ = response_field.validate(models, {}, loc=("response",))
+            return JSONResponse(response_field.serialize(value)).body
+
+        def new_path():
+            return adapter.dump_json(adapter.validate_python(data))
+
+        print(f"{rows:>6} {serializer_cpu(old_path):>10.1f} {serializer_cpu(new_path):>10.1f}")
+
+    print()
+    print("Bytes on the wire for /api/copy-history")
+    print(f"{'rows':>6} {'baseline':>10} {'identity':>10} {'gzip':>10} {'br':>10}")
+    for rows in ROW_COUNTS:
+        sizes = []
+        for client, encoding in [(baseline, "identity"), (current, "identity"), (current, "gzip"), (current, "br")]:
+            response = client.get("/api/copy-history", params={"limit": rows},
+                                  headers={"Accept-Encoding": encoding})
+            sizes.append(int(response.headers["content-length"]))
+        print(f"{rows:>6} " + " ".join(f"{size:>10}" for size in sizes))
+
+    print()
+    print("Compression near the threshold, middleware settings (gzip level 9, br quality 4)")
+    print(f"{'rows':>6} {'raw':>8} {'gzip':>8} {'br':>8} {'gzip us':>8} {'br us':>8}")
+    for rows in THRESHOLD_ROW_COUNTS:
+        data = server.supabase.tables['copy_history'].rows[:rows]
+        body = adapter.dump_json(adapter.validate_python(data))
+        gzip_size = len(gzip.compress(body, compresslevel=9))
+        br_size = len(brotli.compress(body, mode=brotli.MODE_TEXT, quality=4))
+        gzip_cpu = serializer_cpu(lambda: gzip.compress(body, compresslevel=9))
+        br_cpu = serializer_cpu(lambda: brotli.compress(body, mode=brotli.MODE_TEXT, quality=4))
+        print(f"{rows:>6} {len(body):>8} {gzip_size:>8} {br_size:>8} {gzip_cpu:>8.1f} {br_cpu:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""In-process stand-ins for Supabase and emergentintegrations so backend/server.py can load offline"""
+import importlib
+import os
+import sys
+import types
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / 'backend'
+
+
+class FakeQuery:
+    def __init__(self, table):
+        self.table = table
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def order(self, *args, **kwargs):
+        return self
+
+    def limit(self, count):
+        self.table.limit = count
+        return self
+
+    def insert(self, payload):
+        self.table.inserted.append(payload)
+        return self
+
+    def execute(self):
+        rows = self.table.rows
+        if self.table.limit is not None:
+            rows = rows[:self.table.limit]
+        return types.SimpleNamespace(data=rows)
+
+
+class FakeTable:
+    def __init__(self):
+        self.rows = []
+        self.inserted = []
+        self.limit = None
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.tables = {}
+
+    def table(self, name):
+        table = self.tables.setdefault(name, FakeTable())
+        table.limit = None
+        return FakeQuery(table)
+
+
+def load_server():
+    """Import backend/server.py with Supabase and the Claude client stubbed out"""
+    os.environ.setdefault('SUPABASE_URL', 'http://localhost')
+    os.environ.setdefault('SUPABASE_SERVICE_KEY', 'test-key')
+    os.environ.setdefault('CLAUDE_API_KEY', 'test-key')
+
+    supabase_module = types.ModuleType('supabase')
+    supabase_module.Client = FakeSupabase
+    supabase_module.create_client = lambda url, key: FakeSupabase()
+    sys.modules['supabase'] = supabase_module
+
+    chat_module = types.ModuleType('emergentintegrations.llm.chat')
+    chat_module.LlmChat = object
+    chat_module.UserMessage = object
+    sys.modules['emergentintegrations'] = types.ModuleType('emergentintegrations')
+    sys.modules['emergentintegrations.llm'] = types.ModuleType('emergentintegrations.llm')
+    sys.modules['emergentintegrations.llm.chat'] = chat_module
+
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    return importlib.import_module('server')
+
+
+def make_history_rows(count):
+    """Build copy_history rows shaped like Supabase returns them, with emoji-heavy copy"""
+    return [
+        {
+            'id': f'00000000-0000-0000-0000-{i:012d}',
+            'bundle_name': f'Cozy Winter Bundle #{i} ❄️',
+            'tone': 'Warm & Heartfelt',
+            'timestamp': '2024-01-01T00:00:00+00:00',
+            'copy': {
+                'title': f'Cozy Winter Self-Care Gift Set 🧣☕ #{i}',
+                'pitch': 'Wrap yourself in warmth with this thoughtfully curated bundle 💛 '
+                         'Soft merino wool meets artisan hot chocolate for the ultimate cozy night in ✨',
+                'bullets': [
+                    'Wool Scarf 🧣 - Soft merino wool that keeps you toasty',
+                    'Hot Chocolate Mix ☕ - Artisan blend for slow evenings',
+                    'Scented Candle 🕯️ - Cinnamon and vanilla glow',
+                ],
+                'instagram': 'New bundle alert! 🎉❄️ Cozy season is here 🧣☕🕯️ #bundle #handmade #shopsmall',
+            },
+        }
+        for i in range(count)
+    ]
@@ -0,0 +1,120 @@
+import json
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from tests.stubs import load_server, make_history_rows
+
+server = load_server()
+
+
+@pytest.fixture
+def client():
+    server.supabase.tables.clear()
+    return TestClient(server.app)
+
+
+def seed_history(rows):
+    server.supabase.table('copy_history')
+    server.supabase.tables['copy_history'].rows = rows
+
+
+def history_via_response_model(rows):
+    """Serialize rows the way the handler did before, through response_model"""
+    reference_app = FastAPI()
+
+    @reference_app.get("/history", response_model=List[server.CopyHistory])
+    async def history():
+        return [server.CopyHistory(**item) for item in rows]
+
+    return TestClient(reference_app).get("/history").json()
+
+
+def test_copy_history_matches_response_model_output(client):
+    rows = make_history_rows(3)
+    seed_history(rows)
+
+    response = client.get("/api/copy-history", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body == history_via_response_model(rows)
+    assert body[0]["timestamp"] == "2024-01-01T00:00:00Z"
+    assert body[0]["copy"]["instagram"] == rows[0]["copy"]["instagram"]
+
+
+def test_copy_history_respects_limit(client):
+    seed_history(make_history_rows(5))
+
+    response = client.get("/api/copy-history", params={"limit": 2})
+
+    assert len(response.json()) == 2
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("br", "br"),
+    ("gzip", "gzip"),
+    ("gzip, deflate, br", "br"),
+    ("identity", None),
+])
+def test_copy_history_negotiates_compression(client, accept_encoding, expected):
+    seed_history(make_history_rows(10))
+
+    response = client.get("/api/copy-history", headers={"Accept-Encoding": accept_encoding})
+
+    assert response.headers.get("content-encoding") == expected
+    if expected:
+        assert response.headers["vary"] == "Accept-Encoding"
+    assert len(response.json()) == 10
+
+
+def test_small_payloads_are_not_compressed(client):
+    seed_history(make_history_rows(1))
+
+    response = client.get("/api/copy-history", headers={"Accept-Encoding": "br, gzip"})
+
+    assert len(response.content) < server.COMPRESSION_MIN_SIZE
+    assert "content-encoding" not in response.headers
+
+
+def test_generate_copy_inserts_json_serializable_history(client, monkeypatch):
+    generated = server.GeneratedCopy(
+        title="Cozy Winter Bundle 🧣",
+        pitch="Warmth in a box ✨",
+        bullets=["Wool Scarf 🧣", "Hot Chocolate Mix ☕"],
+        instagram="New bundle alert! 🎉 #bundle",
+    )
+
+    async def fake_generate(bundle_name, tone, items):
+        return generated
+
+    monkeypatch.setattr(server, "generate_copy_with_claude", fake_generate)
+
+    response = client.post("/api/generate-copy", json={
+        "bundle_name": "Cozy Winter Bundle",
+        "tone": "warm",
+        "items": [{"title": "Wool Scarf", "description": "Soft merino wool", "price": "25.00"}],
+    })
+
+    assert response.status_code == 200
+    assert response.json() == generated.model_dump(mode='json')
+    [payload] = server.supabase.tables['copy_history'].inserted
+    assert json.loads(json.dumps(payload)) == payload
+    assert payload["tone"] == "Warm & Heartfelt"
+    assert isinstance(payload["timestamp"], str)
+    assert payload["copy"]["instagram"] == generated.instagram
+
+
+def test_status_check_round_trip(client):
+    response = client.post("/api/status", json={"client_name": "tester"})
+
+    assert response.status_code == 200
+    created = response.json()
+    [payload] = server.supabase.tables['status_checks'].inserted
+    assert json.loads(json.dumps(payload)) == created
+
+    server.supabase.tables['status_checks'].rows = [payload]
+    assert client.get("/api/status").json() == [created]